@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Long-lived helper that keeps an open HTTPS connection to the usage API.
+
+statusline.py connects over a Unix domain socket (~/.claude/statusline.sock)
+and receives the cached-or-freshly-fetched usage body as JSON. Holding one
+TLS connection across requests avoids the TCP + TLS handshake that
+urllib.request pays on every statusline render. The daemon is started
+lazily by statusline.py and exits on its own after a period of idleness.
+"""
+import http.client
+import json
+import os
+import socket
+import ssl
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import statusline
+
+SOCKET_PATH = statusline.DAEMON_SOCKET_PATH
+IDLE_TIMEOUT = 600  # seconds without a client before the daemon exits
+
+# Persistent connection and in-memory usage cache
+_conn = None
+_body = None
+_ts = 0.0
+
+def fetch_usage_keepalive(access_token: str) -> dict | None:
+    """Fetch the usage body over the persistent connection.
+
+    Retries once on a fresh connection if the kept-alive one has gone bad
+    (server idle close, network change, etc.).
+    """
+    global _conn
+    for _ in range(2):
+        try:
+            if _conn is None:
+                _conn = http.client.HTTPSConnection(
+                    "api.anthropic.com", timeout=5,
+                    context=ssl.create_default_context(),
+                )
+            _conn.request("GET", "/api/oauth/usage", headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "anthropic-beta": "oauth-2025-04-20",
+            })
+            resp = _conn.getresponse()
+            data = resp.read()
+            if resp.status == 200:
+                return statusline._loads(data)
+            if resp.status in (401, 403):
+                statusline.invalidate_token_cache()
+            return None
+        except (OSError, http.client.HTTPException, ValueError):
+            try:
+                _conn.close()
+            except Exception:
+                pass
+            _conn = None
+    return None
+
+def get_body() -> dict | None:
+    """Return the usage body, serving the in-memory cache when fresh."""
+    global _body, _ts
+    now = time.time()
+    if _body is not None and now - _ts < statusline.USAGE_CACHE_TTL:
+        return _body
+    access_token = statusline.get_access_token()
+    if not access_token:
+        return _body
+    body = fetch_usage_keepalive(access_token)
+    if body is not None:
+        _body, _ts = body, now
+        # Share with statusline.py's disk cache so plain renders hit it too
+        statusline.save_cached_usage(statusline.USAGE_CACHE_PATH, body)
+    return _body
+
+def handle(client: socket.socket) -> None:
+    try:
+        client.settimeout(5)
+        client.recv(64)  # request is just "GET\n"
+        body = get_body()
+        client.sendall(json.dumps(body).encode() if body is not None else b"")
+    except OSError:
+        pass
+
+def bind_socket(path: str) -> socket.socket | None:
+    """Bind the listening socket, cleaning up a stale socket file if needed."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        return server
+    except OSError:
+        pass
+    # Address in use: either another daemon is alive, or the file is stale
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return None  # live daemon already serving
+    except OSError:
+        pass
+    finally:
+        probe.close()
+    try:
+        os.unlink(path)
+        server.bind(path)
+        return server
+    except OSError:
+        return None
+
+def main():
+    path = str(SOCKET_PATH)
+    server = bind_socket(path)
+    if server is None:
+        return
+    try:
+        server.listen(4)
+        server.settimeout(IDLE_TIMEOUT)
+        while True:
+            try:
+                client, _ = server.accept()
+            except socket.timeout:
+                break
+            with client:
+                handle(client)
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+if __name__ == "__main__":
+    main()
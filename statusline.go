@@ -0,0 +1,624 @@
+// Command statusline renders the Claude Code status line.
+//
+// It is a compiled port of statusline.py covering the hot paths: stdin JSON
+// in, two formatted lines out, with the git status byte-scan, the disk-backed
+// usage/token caches, and a keep-alive HTTP client. Building it removes the
+// Python interpreter cold start (~30-80ms) from every prompt:
+//
+//	go build -o statusline statusline.go
+//
+// statusline.py execs the binary automatically when it sits alongside it, so
+// the configured command and the stdin protocol stay unchanged.
+package main
+
+import (
+	"context"
+	"crypto/sha1"
+	"encoding/json"
+	"fmt"
+	"io"
+	"math"
+	"net/http"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"regexp"
+	"runtime"
+	"strconv"
+	"strings"
+	"time"
+)
+
+const (
+	usageAPIURL          = "https://api.anthropic.com/api/oauth/usage"
+	usageThresholdHigh   = 80
+	usageThresholdMedium = 50
+
+	usageCacheTTL = 60 * time.Second
+	tokenCacheTTL = time.Hour
+	gitCacheTTL   = 2 * time.Second
+
+	// Max age for the stale-usage fallback; effectively unlimited, mirroring
+	// the Python path's float("inf")
+	staleUsageMaxAge = time.Duration(math.MaxInt64)
+
+	cyan   = "\033[36m"
+	yellow = "\033[33m"
+	red    = "\033[31m"
+	dim    = "\033[2m"
+	reset  = "\033[0m"
+
+	dimFactor = 0.3
+	barWidth  = 10
+
+	osc8Prefix = "\x1b]8;;"
+	osc8Sep    = "\x07"
+	osc8Suffix = "\x1b]8;;\x07"
+)
+
+var blocks = []string{"▏", "▎", "▍", "▌", "▋", "▊", "▉", "█"}
+
+// Matches the porcelain branch header; group 1 is empty for detached HEAD.
+// The branch name is captured lazily and anchored on the "..." separator /
+// end of header, so names containing dots survive intact.
+var gitHeaderRe = regexp.MustCompile(
+	`^## (?:HEAD \(no branch\)|(\S+?)(?:\.\.\.\S+(?: \[(?:gone|(?:ahead (\d+))?(?:, )?(?:behind (\d+))?)\])?)?$)`)
+
+var httpClient = &http.Client{
+	Timeout: 5 * time.Second,
+	Transport: &http.Transport{
+		MaxIdleConnsPerHost: 1,
+		IdleConnTimeout:     10 * time.Minute,
+	},
+}
+
+var (
+	claudeDir       string
+	credentialsPath string
+	cacheDir        string
+	usageCachePath  string
+	tokenCachePath  string
+)
+
+func initPaths() bool {
+	home, err := os.UserHomeDir()
+	if err != nil {
+		return false
+	}
+	claudeDir = filepath.Join(home, ".claude")
+	credentialsPath = filepath.Join(claudeDir, ".credentials.json")
+	cacheDir = filepath.Join(claudeDir, "statusline-cache")
+	usageCachePath = filepath.Join(cacheDir, "usage.json")
+	tokenCachePath = filepath.Join(cacheDir, "token")
+	return true
+}
+
+type statusInput struct {
+	Cwd       string `json:"cwd"`
+	Workspace struct {
+		ProjectDir string `json:"project_dir"`
+	} `json:"workspace"`
+	Model struct {
+		DisplayName string `json:"display_name"`
+	} `json:"model"`
+	ContextWindow struct {
+		UsedPercentage float64 `json:"used_percentage"`
+	} `json:"context_window"`
+}
+
+type usageWindow struct {
+	Utilization float64 `json:"utilization"`
+	ResetsAt    *string `json:"resets_at"`
+}
+
+type usageBody struct {
+	FiveHour usageWindow `json:"five_hour"`
+	SevenDay usageWindow `json:"seven_day"`
+}
+
+// Cache record layout shared with statusline.py: {"ts": ..., "body": ...}.
+type usageCacheRecord struct {
+	TS   float64         `json:"ts"`
+	Body json.RawMessage `json:"body"`
+}
+
+func main() {
+	raw, err := io.ReadAll(os.Stdin)
+	var input statusInput
+	if err != nil || json.Unmarshal(raw, &input) != nil {
+		fmt.Println("statusline: no data")
+		return
+	}
+	if !initPaths() {
+		fmt.Println("statusline: no home directory")
+		return
+	}
+
+	projectDir := input.Workspace.ProjectDir
+	if projectDir == "" {
+		projectDir = input.Cwd
+	}
+
+	// Git status and the usage fetch are both pure I/O; run them concurrently
+	gitCh := make(chan string, 1)
+	usageCh := make(chan string, 1)
+	go func() { gitCh <- formatGitBranch(projectDir) }()
+	go func() { usageCh <- formatUsageSegment() }()
+
+	var line strings.Builder
+	line.WriteString("📂 ")
+	line.WriteString(folderLink(input.Cwd))
+	line.WriteString(<-gitCh)
+	line.WriteString("\n🧠 ")
+	line.WriteString(cyan)
+	line.WriteString(input.Model.DisplayName)
+	line.WriteString(reset)
+	line.WriteString(" · ")
+	line.WriteString(progressBar(input.ContextWindow.UsedPercentage, "📝", nil))
+	line.WriteString(<-usageCh)
+	line.WriteString("\n")
+
+	os.Stdout.WriteString(line.String())
+}
+
+// supportsOSC8 reports whether the terminal understands OSC 8 hyperlinks.
+func supportsOSC8() bool {
+	switch os.Getenv("TERM_PROGRAM") {
+	case "iTerm.app", "WezTerm", "Hyper", "Alacritty":
+		return true
+	}
+	for _, v := range []string{"ITERM_SESSION_ID", "WEZTERM_PANE", "WT_SESSION", "KITTY_WINDOW_ID"} {
+		if os.Getenv(v) != "" {
+			return true
+		}
+	}
+	return strings.Contains(os.Getenv("TERM"), "kitty")
+}
+
+// folderLink renders the folder name, clickable (opens VSCode) where supported.
+func folderLink(path string) string {
+	name := filepath.Base(strings.TrimRight(path, "/"))
+	if !supportsOSC8() {
+		return name
+	}
+	return osc8Prefix + "vscode://file" + path + osc8Sep + name + osc8Suffix
+}
+
+// findGitdir locates the gitdir for path, walking up a bounded number of
+// parents and following worktree/submodule .git files to the real gitdir.
+// Returns "" if path is not inside a git repo.
+func findGitdir(path string) string {
+	for i := 0; i < 8; i++ {
+		dotgit := filepath.Join(path, ".git")
+		info, err := os.Lstat(dotgit)
+		if err != nil {
+			parent := filepath.Dir(path)
+			if parent == path {
+				return ""
+			}
+			path = parent
+			continue
+		}
+		if info.IsDir() {
+			return dotgit
+		}
+		raw, err := os.ReadFile(dotgit)
+		if err != nil {
+			return ""
+		}
+		first := strings.TrimSpace(strings.SplitN(string(raw), "\n", 2)[0])
+		if strings.HasPrefix(first, "gitdir: ") {
+			target := strings.TrimPrefix(first, "gitdir: ")
+			if !filepath.IsAbs(target) {
+				target = filepath.Join(path, target)
+			}
+			return filepath.Clean(target)
+		}
+		return ""
+	}
+	return ""
+}
+
+// gitStateKey is the cache key shared with statusline.py: the mtimes (ns) of
+// HEAD and the index, which change whenever the repo state does.
+func gitStateKey(gitdir string) []int64 {
+	key := make([]int64, 0, 2)
+	for _, name := range []string{"HEAD", "index"} {
+		var mtime int64
+		if info, err := os.Stat(filepath.Join(gitdir, name)); err == nil {
+			mtime = info.ModTime().UnixNano()
+		}
+		key = append(key, mtime)
+	}
+	return key
+}
+
+// Cache record layout shared with statusline.py's git-*.json files.
+type gitCacheRecord struct {
+	TS     float64 `json:"ts"`
+	Key    []int64 `json:"key"`
+	Branch string  `json:"branch"`
+}
+
+func loadGitCache(path string) *gitCacheRecord {
+	raw, err := os.ReadFile(path)
+	if err != nil {
+		return nil
+	}
+	var record gitCacheRecord
+	if json.Unmarshal(raw, &record) != nil {
+		return nil
+	}
+	return &record
+}
+
+func saveGitCache(path string, key []int64, branch string) {
+	record, err := json.Marshal(gitCacheRecord{
+		TS:     float64(time.Now().UnixNano()) / float64(time.Second),
+		Key:    key,
+		Branch: branch,
+	})
+	if err != nil {
+		return
+	}
+	os.MkdirAll(cacheDir, 0o755)
+	tmp := path + ".tmp"
+	if os.WriteFile(tmp, record, 0o644) == nil {
+		os.Rename(tmp, path)
+	}
+}
+
+func keysEqual(a, b []int64) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if a[i] != b[i] {
+			return false
+		}
+	}
+	return true
+}
+
+// formatGitBranch returns the branch segment, serving the disk cache when
+// HEAD/index mtimes are unchanged within the freshness floor, and degrading
+// to the last cached string (dimmed) when git fails or times out.
+func formatGitBranch(projectDir string) string {
+	if projectDir == "" {
+		return ""
+	}
+	gitdir := findGitdir(projectDir)
+	if gitdir == "" {
+		return ""
+	}
+
+	sum := sha1.Sum([]byte(gitdir))
+	cachePath := filepath.Join(cacheDir, fmt.Sprintf("git-%x.json", sum[:8]))
+	key := gitStateKey(gitdir)
+	cached := loadGitCache(cachePath)
+	if cached != nil && keysEqual(cached.Key, key) &&
+		time.Since(time.Unix(0, int64(cached.TS*float64(time.Second)))) < gitCacheTTL {
+		return cached.Branch
+	}
+
+	branch, ok := runGitStatus(projectDir)
+	if !ok {
+		// git failed or timed out; serve the last known state, dimmed,
+		// instead of flickering the segment away
+		if cached != nil && cached.Branch != "" {
+			return dim + cached.Branch + reset
+		}
+		return ""
+	}
+	saveGitCache(cachePath, key, branch)
+	return branch
+}
+
+// runGitStatus builds the branch segment from one NUL-delimited git status;
+// ok is false when git fails or times out.
+func runGitStatus(projectDir string) (string, bool) {
+	timeout := 5 * time.Second
+	if v := os.Getenv("CLAUDE_STATUSLINE_GIT_TIMEOUT"); v != "" {
+		if secs, err := strconv.ParseFloat(v, 64); err == nil {
+			timeout = time.Duration(secs * float64(time.Second))
+		}
+	}
+	ctx, cancel := context.WithTimeout(context.Background(), timeout)
+	defer cancel()
+	cmd := exec.CommandContext(ctx, "git", "status", "-z", "--porcelain=v1", "-b",
+		"--no-renames", "--untracked-files=normal")
+	cmd.Dir = projectDir
+	out, err := cmd.Output()
+	if err != nil {
+		return "", false
+	}
+
+	records := strings.Split(string(out), "\x00")
+	m := gitHeaderRe.FindStringSubmatch(records[0])
+	if m == nil {
+		return "", true
+	}
+	branch := m[1]
+	if branch == "" {
+		branch = "detached HEAD"
+	}
+	ahead, _ := strconv.Atoi(m[2])
+	behind, _ := strconv.Atoi(m[3])
+
+	staged, unstaged := 0, 0
+	for _, rec := range records[1:] {
+		if len(rec) < 2 {
+			continue
+		}
+		if rec[0] != ' ' && rec[0] != '?' { // Index has changes (staged)
+			staged++
+		}
+		if rec[1] != ' ' { // Worktree has changes or untracked
+			unstaged++
+		}
+	}
+
+	var parts []string
+	if staged > 0 {
+		parts = append(parts, fmt.Sprintf("%d staged", staged))
+	}
+	if unstaged > 0 {
+		parts = append(parts, fmt.Sprintf("%d unstaged", unstaged))
+	}
+	if ahead > 0 {
+		parts = append(parts, fmt.Sprintf("%d ahead", ahead))
+	}
+	if behind > 0 {
+		parts = append(parts, fmt.Sprintf("%d behind", behind))
+	}
+
+	suffix := ""
+	if len(parts) > 0 {
+		suffix = " (" + strings.Join(parts, ", ") + ")"
+	}
+	return " · 🌿 " + branch + suffix, true
+}
+
+// accessToken returns the OAuth token, serving the shared disk cache unless
+// fresh is true (e.g. after the API rejected the cached token).
+func accessToken(fresh bool) string {
+	if !fresh {
+		if info, err := os.Stat(tokenCachePath); err == nil && time.Since(info.ModTime()) < tokenCacheTTL {
+			if b, err := os.ReadFile(tokenCachePath); err == nil {
+				if token := strings.TrimSpace(string(b)); token != "" {
+					return token
+				}
+			}
+		}
+	}
+
+	var creds []byte
+	switch runtime.GOOS {
+	case "darwin":
+		// Bounded like the Python path: the Keychain can block on an ACL
+		// prompt, which must not wedge the statusline
+		ctx, cancel := context.WithTimeout(context.Background(), 2*time.Second)
+		defer cancel()
+		out, err := exec.CommandContext(ctx, "security", "find-generic-password",
+			"-s", "Claude Code-credentials", "-w").Output()
+		if err != nil {
+			return ""
+		}
+		creds = out
+	case "linux":
+		b, err := os.ReadFile(credentialsPath)
+		if err != nil {
+			return ""
+		}
+		creds = b
+	default:
+		return "" // Windows not supported
+	}
+
+	var parsed struct {
+		ClaudeAiOauth struct {
+			AccessToken string `json:"accessToken"`
+		} `json:"claudeAiOauth"`
+	}
+	if json.Unmarshal(creds, &parsed) != nil {
+		return ""
+	}
+	token := parsed.ClaudeAiOauth.AccessToken
+	if token != "" {
+		os.MkdirAll(cacheDir, 0o755)
+		os.WriteFile(tokenCachePath, []byte(token), 0o600)
+	}
+	return token
+}
+
+// loadCachedUsage returns the cached usage body if fresher than maxAge.
+func loadCachedUsage(maxAge time.Duration) *usageBody {
+	raw, err := os.ReadFile(usageCachePath)
+	if err != nil {
+		return nil
+	}
+	var record usageCacheRecord
+	if json.Unmarshal(raw, &record) != nil {
+		return nil
+	}
+	age := time.Since(time.Unix(0, int64(record.TS*float64(time.Second))))
+	if age >= maxAge {
+		return nil
+	}
+	var body usageBody
+	if json.Unmarshal(record.Body, &body) != nil {
+		return nil
+	}
+	return &body
+}
+
+// saveCachedUsage writes the raw usage body to the cache atomically.
+func saveCachedUsage(raw json.RawMessage) {
+	record, err := json.Marshal(usageCacheRecord{
+		TS:   float64(time.Now().UnixNano()) / float64(time.Second),
+		Body: raw,
+	})
+	if err != nil {
+		return
+	}
+	os.MkdirAll(cacheDir, 0o755)
+	tmp := usageCachePath + ".tmp"
+	if os.WriteFile(tmp, record, 0o644) == nil {
+		os.Rename(tmp, usageCachePath)
+	}
+}
+
+// fetchUsage calls the usage API; the shared transport keeps the connection
+// alive for any retry within this process. authFailed reports a 401/403 so
+// the caller can invalidate the token cache and retry once.
+func fetchUsage(token string) (raw json.RawMessage, authFailed bool) {
+	req, err := http.NewRequest("GET", usageAPIURL, nil)
+	if err != nil {
+		return nil, false
+	}
+	req.Header.Set("Authorization", "Bearer "+token)
+	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("anthropic-beta", "oauth-2025-04-20")
+
+	resp, err := httpClient.Do(req)
+	if err != nil {
+		return nil, false
+	}
+	defer resp.Body.Close()
+	data, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, false
+	}
+	if resp.StatusCode == http.StatusUnauthorized || resp.StatusCode == http.StatusForbidden {
+		return nil, true
+	}
+	if resp.StatusCode != http.StatusOK || !json.Valid(data) {
+		return nil, false
+	}
+	return data, false
+}
+
+// formatUsageSegment produces the trailing " · 🕔 ... · 📅 ..." segment, or
+// "" when no credentials are available.
+func formatUsageSegment() string {
+	token := accessToken(false)
+	if token == "" {
+		return ""
+	}
+
+	stale := false
+	body := loadCachedUsage(usageCacheTTL)
+	if body == nil {
+		raw, authFailed := fetchUsage(token)
+		if raw == nil && authFailed {
+			// Cached token was rejected; drop it and retry once with a fresh one
+			os.Remove(tokenCachePath)
+			if freshToken := accessToken(true); freshToken != "" {
+				raw, _ = fetchUsage(freshToken)
+			}
+		}
+		if raw != nil {
+			saveCachedUsage(raw)
+			var parsed usageBody
+			if json.Unmarshal(raw, &parsed) == nil {
+				body = &parsed
+			}
+		}
+	}
+	if body == nil {
+		// API failed: fall back to the last cached body, however old
+		if body = loadCachedUsage(staleUsageMaxAge); body != nil {
+			stale = true
+		}
+	}
+	if body == nil {
+		return " · " + red + "Usage: N/A" + reset
+	}
+
+	segment := " · " + progressBar(body.FiveHour.Utilization, "🕔", body.FiveHour.ResetsAt) +
+		" · " + progressBar(body.SevenDay.Utilization, "📅", body.SevenDay.ResetsAt)
+	if stale {
+		segment += " " + yellow + "(stale)" + reset
+	}
+	return segment
+}
+
+func usageRGB(pct int) (int, int, int) {
+	switch {
+	case pct >= usageThresholdHigh:
+		return 170, 0, 0
+	case pct >= usageThresholdMedium:
+		return 170, 170, 0
+	}
+	return 0, 170, 0
+}
+
+// progressBar renders a colored 10-char bar with percentage and reset time.
+func progressBar(progress float64, emoji string, resetsAt *string) string {
+	pct := int(progress + 0.5)
+	if pct < 0 {
+		pct = 0
+	} else if pct > 100 {
+		pct = 100
+	}
+
+	totalBlocks := barWidth * 8 // 8 sub-blocks per character
+	filled := pct * totalBlocks / 100
+	fullChars := filled / 8
+	remainder := filled % 8
+	empty := barWidth - fullChars
+
+	r, g, b := usageRGB(pct)
+	fg := fmt.Sprintf("\033[38;2;%d;%d;%dm", r, g, b)
+	bg := fmt.Sprintf("\033[48;2;%d;%d;%dm",
+		int(float64(r)*dimFactor), int(float64(g)*dimFactor), int(float64(b)*dimFactor))
+
+	var bar strings.Builder
+	bar.WriteString(fg)
+	bar.WriteString(bg)
+	bar.WriteString(strings.Repeat("█", fullChars))
+	if remainder > 0 {
+		bar.WriteString(blocks[remainder-1])
+		empty--
+	}
+	bar.WriteString(strings.Repeat(" ", empty))
+	bar.WriteString(reset)
+	bar.WriteString(fg)
+
+	suffix := ""
+	if t := formatTimeRemaining(resetsAt); t != "" {
+		suffix = " (" + t + ")"
+	}
+	prefix := ""
+	if emoji != "" {
+		prefix = emoji + " "
+	}
+	return fmt.Sprintf("%s%s %d%%%s%s", prefix, bar.String(), pct, suffix, reset)
+}
+
+// formatTimeRemaining formats the time until reset as a compact string.
+func formatTimeRemaining(resetsAt *string) string {
+	if resetsAt == nil || *resetsAt == "" {
+		return ""
+	}
+	resetTime, err := time.Parse(time.RFC3339, *resetsAt)
+	if err != nil {
+		return ""
+	}
+	remaining := time.Until(resetTime)
+	if remaining <= 0 {
+		return ""
+	}
+
+	totalMinutes := int(remaining.Minutes())
+	hours := totalMinutes / 60
+	minutes := totalMinutes % 60
+
+	if hours >= 24 {
+		return fmt.Sprintf("%dd", hours/24)
+	}
+	if hours > 0 {
+		return fmt.Sprintf("%dh%02dm", hours, minutes)
+	}
+	return fmt.Sprintf("%dm", minutes)
+}
@@ -2,19 +2,33 @@
 import os
 import sys
 import json
-import urllib.request
-import urllib.error
-import subprocess
-import platform
-from pathlib import Path
+import re
+import time
+import socket
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timezone
 
+# Heavy stdlib modules (urllib pulls in ssl/email/http, plus subprocess and
+# platform) are imported lazily inside the functions that need them, so a
+# warm-cache render never pays their import cost
+
+# Prefer orjson's C parser when available (~3-5x faster than stdlib json);
+# both accept str or bytes and raise a ValueError subclass on bad input
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # ANSI colors
 BLUE = "\033[34m"
 GREEN = "\033[32m"
 YELLOW = "\033[33m"
 RED = "\033[31m"
 CYAN = "\033[36m"
+DIM = "\033[2m"
 RESET = "\033[0m"
 
 # RGB colors for progress bars (true color)
@@ -26,10 +40,34 @@ DIM_FACTOR = 0.3  # Background brightness
 USAGE_API_URL = "https://api.anthropic.com/api/oauth/usage"
 USAGE_THRESHOLD_HIGH = 80
 USAGE_THRESHOLD_MEDIUM = 50
-CREDENTIALS_PATH = Path.home() / ".claude" / ".credentials.json"
+# Plain strings rather than pathlib: open()/os.* accept them directly and
+# skip the PurePath allocation on every use
+CREDENTIALS_PATH = os.path.expanduser("~/.claude/.credentials.json")
+CACHE_DIR = os.path.expanduser("~/.claude/statusline-cache")
+USAGE_CACHE_PATH = os.path.join(CACHE_DIR, "usage.json")
+USAGE_CACHE_TTL = 60  # seconds; usage counters change slowly
+TOKEN_CACHE_PATH = os.path.join(CACHE_DIR, "token")
+TOKEN_CACHE_TTL = 3600  # seconds; tokens rotate rarely
+GIT_CACHE_TTL = 2  # seconds; freshness floor between git status runs
+# Matches the usage API timeout; overridable for slow filesystems/monorepos
+try:
+    GIT_TIMEOUT = float(os.environ.get("CLAUDE_STATUSLINE_GIT_TIMEOUT", "5"))
+except ValueError:
+    GIT_TIMEOUT = 5.0
+DAEMON_SOCKET_PATH = os.path.expanduser("~/.claude/statusline.sock")
+DAEMON_TIMEOUT = 0.3  # seconds; a warm daemon answers in ~1ms
 
 BLOCKS = "▏▎▍▌▋▊▉█"
 
+# Matches the porcelain branch header: "## branch...upstream [ahead N, behind M]"
+# or "## HEAD (no branch)" for detached HEAD (group 1 is None in that case).
+# The branch name is captured lazily and anchored on the "..." separator /
+# end of header, so names containing dots survive intact
+_GIT_HEADER_RE = re.compile(
+    rb"^## (?:HEAD \(no branch\)|(\S+?)(?:\.\.\.\S+"
+    rb"(?: \[(?:gone|(?:ahead (\d+))?(?:, )?(?:behind (\d+))?)\])?)?$)"
+)
+
 # OSC 8 hyperlink escape sequences (for iTerm2, etc.)
 OSC8_PREFIX = "\x1b]8;;"
 OSC8_SEP = "\x07"
@@ -38,7 +76,7 @@ OSC8_SUFFIX = "\x1b]8;;\x07"
 def main():
     try:
         raw = sys.stdin.read()
-        data = json.loads(raw)
+        data = _loads(raw)
     except Exception:
         print("statusline: no data")
         return
@@ -50,39 +88,52 @@ def main():
     model = data.get("model", {}).get("display_name", "")
     context_window = data.get("context_window", {})
 
-    # Fetch usage from API (if credentials available)
-    access_token = get_access_token()
-    usage_str = ""
-    if access_token:
-        usage_data = fetch_usage(access_token)
-        usage_str = f" · {format_usage(usage_data)}"
+    # Run git status and the usage fetch concurrently; both are pure I/O,
+    # so wall-clock becomes max(git, http) instead of git + http
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        git_future = executor.submit(format_git_branch, project_directory)
+        usage_future = executor.submit(_get_usage_if_token)
+
+        # Format the static parts while the workers wait on I/O
+        prefix = f"🧠 {CYAN}{model}{RESET} · {format_context_usage(context_window)}"
+
+        git_str = git_future.result()
+        usage = usage_future.result()
+
+    usage_str = f" · {format_usage(*usage)}" if usage is not None else ""
 
-    line = f"📂 {current_directory}{format_git_branch(project_directory)}\n🧠 {CYAN}{model}{RESET} · {format_context_usage(context_window)}{usage_str}"
+    line = f"📂 {current_directory}{git_str}\n{prefix}{usage_str}\n"
 
-    print(line)
+    # Encode once and emit in a single buffered write instead of routing
+    # each piece through the TextIOWrapper encoder
+    sys.stdout.buffer.write(line.encode("utf-8", "replace"))
+    sys.stdout.buffer.flush()
 
-def supports_osc8() -> bool:
+def _compute_supports_osc8() -> bool:
     """Check if the terminal supports OSC 8 hyperlinks."""
+    env = os.environ
     # Known OSC 8 supporting terminals
-    term_program = os.environ.get("TERM_PROGRAM", "")
-    if term_program in ("iTerm.app", "WezTerm", "Hyper", "Alacritty"):
+    if env.get("TERM_PROGRAM", "") in ("iTerm.app", "WezTerm", "Hyper", "Alacritty"):
         return True
     # Terminal-specific env vars
-    if any(os.environ.get(var) for var in ("ITERM_SESSION_ID", "WEZTERM_PANE", "WT_SESSION", "KITTY_WINDOW_ID")):
+    if any(env.get(var) for var in ("ITERM_SESSION_ID", "WEZTERM_PANE", "WT_SESSION", "KITTY_WINDOW_ID")):
         return True
     # Kitty
-    if "kitty" in os.environ.get("TERM", ""):
+    if "kitty" in env.get("TERM", ""):
         return True
     return False
 
+# The terminal can't change during a process lifetime; compute once at import
+_SUPPORTS_OSC8 = _compute_supports_osc8()
+
 def hyperlink(url: str, text: str) -> str:
     """Create an OSC 8 hyperlink (clickable in iTerm2, etc.)."""
     return f"{OSC8_PREFIX}{url}{OSC8_SEP}{text}{OSC8_SUFFIX}"
 
 def vscode_folder_link(path: str) -> str:
     """Create a clickable folder name that opens in VSCode."""
-    folder_name = Path(path).name
-    if not supports_osc8():
+    folder_name = os.path.basename(path.rstrip("/"))
+    if not _SUPPORTS_OSC8:
         return folder_name
     vscode_url = f"vscode://file{path}"
     return hyperlink(vscode_url, folder_name)
@@ -91,39 +142,139 @@ def format_context_usage(context_window):
     percent_used = context_window.get("used_percentage", 0)
     return get_progress_bar(percent_used, emoji="📝")
 
+@lru_cache(maxsize=32)
+def _find_gitdir(path: str) -> str | None:
+    """Locate the gitdir for path, or None if path is not inside a git repo.
+
+    Walks up a bounded number of parents to cover cwds nested inside a repo,
+    and follows worktree/submodule .git files to the real gitdir.
+    """
+    for _ in range(8):
+        dotgit = os.path.join(path, ".git")
+        try:
+            os.lstat(dotgit)
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+            continue
+        if os.path.isdir(dotgit):
+            return dotgit
+        try:
+            with open(dotgit) as f:
+                first = f.readline().strip()
+        except OSError:
+            return None
+        if first.startswith("gitdir: "):
+            return os.path.normpath(os.path.join(path, first[len("gitdir: "):]))
+        return None
+    return None
+
+def _git_state_key(gitdir: str) -> list:
+    """Cache key that changes whenever HEAD or the index does."""
+    key = []
+    for name in ("HEAD", "index"):
+        try:
+            key.append(os.stat(os.path.join(gitdir, name)).st_mtime_ns)
+        except OSError:
+            key.append(0)
+    return key
+
+def _load_git_cache(path) -> dict | None:
+    try:
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _save_git_cache(path: str, key: list, branch: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"ts": time.time(), "key": key, "branch": branch}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
 def format_git_branch(project_directory):
-    """Get git info from single git status call. Works with regular repos and worktrees."""
+    """Get git info, caching the formatted string keyed on repo state.
+
+    Skips the git subprocess entirely when HEAD/index mtimes are unchanged
+    and the cached record is within the freshness floor; falls back to the
+    last cached string if git fails or times out.
+    """
+    if not project_directory:
+        return ""
+    gitdir = _find_gitdir(project_directory)
+    if gitdir is None:
+        return ""
+
+    cache_path = os.path.join(CACHE_DIR, f"git-{hashlib.sha1(gitdir.encode()).hexdigest()[:16]}.json")
+    key = _git_state_key(gitdir)
+    cached = _load_git_cache(cache_path)
+    if (cached is not None and cached.get("key") == key
+            and time.time() - cached.get("ts", 0) < GIT_CACHE_TTL):
+        return cached.get("branch", "")
+
+    result = _run_git_status(project_directory)
+    if result is None:
+        # git failed or timed out; serve the last known state, dimmed, instead
+        # of flickering the segment away
+        stale = cached.get("branch", "") if cached else ""
+        return f"{DIM}{stale}{RESET}" if stale else ""
+    _save_git_cache(cache_path, key, result)
+    return result
+
+def _run_git_status(project_directory) -> str | None:
+    """Run git status and format the branch segment; None on failure/timeout."""
+    import subprocess
+    import tempfile
+
     staged = unstaged = ahead = behind = 0
     branch = ""
 
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain", "-b"],
-            capture_output=True, text=True, timeout=2, cwd=project_directory
-        )
-        if result.returncode != 0:
+        # Route stdout through a temp file rather than a pipe: git can produce
+        # large output on dirty repos, and file-backed stdout avoids PIPE stalls
+        with tempfile.TemporaryFile() as out:
+            proc = subprocess.Popen(
+                ["git", "status", "-z", "--porcelain=v1", "-b",
+                 "--no-renames", "--untracked-files=normal"],
+                stdout=out, stderr=subprocess.DEVNULL, bufsize=-1,
+                cwd=project_directory,
+            )
+            try:
+                proc.communicate(timeout=GIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+            if proc.returncode != 0:
+                return ""
+            out.seek(0)
+            stdout = out.read()
+
+        # -z gives NUL-delimited records; the branch header comes first.
+        # Parse raw bytes to skip decoding the (possibly large) path list.
+        header, _, rest = stdout.partition(b'\0')
+        match = _GIT_HEADER_RE.match(header)
+        if not match:
             return ""
-
-        for line in result.stdout.splitlines():
-            if line.startswith('## '):
-                # Parse: ## branch...upstream [ahead N, behind M]
-                # or: ## HEAD (no branch) for detached HEAD
-                branch_part = line[3:]
-                if branch_part.startswith('HEAD (no branch)'):
-                    branch = "detached HEAD"
-                else:
-                    branch = branch_part.split('...')[0].split()[0]
-                    if '[ahead ' in line:
-                        ahead = int(line.split('[ahead ')[1].split(',')[0].split(']')[0])
-                    if '[behind ' in line:
-                        behind = int(line.split('[behind ')[1].split(']')[0])
-            elif len(line) >= 2:
-                if line[0] not in ' ?':  # Index has changes (staged)
-                    staged += 1
-                if line[1] != ' ':  # Worktree has changes or untracked
-                    unstaged += 1
+        branch = match.group(1).decode() if match.group(1) else "detached HEAD"
+        ahead = int(match.group(2) or 0)
+        behind = int(match.group(3) or 0)
+
+        # XY status codes sit at fixed offsets in each record; gather them
+        # into two columns and count with C-level byte scans instead of an
+        # interpreted loop per changed file
+        xy = b"".join(rec[:2] for rec in rest.split(b'\0') if len(rec) >= 2)
+        x_col = xy[::2]
+        y_col = xy[1::2]
+        staged = len(x_col) - x_col.count(b' ') - x_col.count(b'?')  # Index has changes
+        unstaged = len(y_col) - y_col.count(b' ')  # Worktree changes or untracked
     except (subprocess.TimeoutExpired, OSError, ValueError):
-        return ""
+        return None
 
     if not branch:
         return ""
@@ -142,46 +293,292 @@ def format_git_branch(project_directory):
     suffix = f" ({', '.join(parts)})" if parts else ""
     return f" · 🌿 {branch}{suffix}"
 
-def get_access_token() -> str | None:
-    """Retrieve the access token based on the platform."""
+def load_cached_token(max_age: float) -> str | None:
+    """Return the cached access token if its file is fresher than max_age."""
+    try:
+        st = os.stat(TOKEN_CACHE_PATH)
+        if time.time() - st.st_mtime < max_age:
+            with open(TOKEN_CACHE_PATH) as f:
+                return f.read().strip() or None
+    except OSError:
+        pass
+    return None
+
+def save_cached_token(token: str) -> None:
+    """Cache the access token with owner-only permissions."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(token)
+    except OSError:
+        pass
+
+def invalidate_token_cache() -> None:
+    try:
+        os.unlink(TOKEN_CACHE_PATH)
+    except OSError:
+        pass
+
+def get_access_token(fresh: bool = False) -> str | None:
+    """Retrieve the access token based on the platform, caching it on disk.
+
+    The Keychain/credentials lookup runs only on cache miss or when fresh is
+    True (e.g. after the API rejected the cached token).
+    """
+    if not fresh:
+        token = load_cached_token(TOKEN_CACHE_TTL)
+        if token:
+            return token
+
+    import platform
     system = platform.system()
 
     if system == "Darwin":  # macOS
-        return get_access_token_macos()
+        token = get_access_token_macos()
     elif system == "Linux":
-        return get_access_token_linux()
+        token = get_access_token_linux()
     else:
         return None # Windows not supported
 
+    if token:
+        save_cached_token(token)
+    return token
+
+def _keychain_lookup_ctypes() -> bytes | None:
+    """Query the macOS Keychain in-process via Security.framework.
+
+    Calling SecItemCopyMatching directly skips the fork+exec of the heavy
+    /usr/bin/security binary (and the ACL prompt path it can hit). Returns
+    the raw credentials blob, or None on any failure so the caller can fall
+    back to the subprocess path.
+    """
+    import ctypes
+    try:
+        cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+        sec = ctypes.CDLL("/System/Library/Frameworks/Security.framework/Security")
+    except OSError:
+        return None
+
+    try:
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFDictionaryCreate.restype = ctypes.c_void_p
+        cf.CFDictionaryCreate.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p,
+        ]
+        cf.CFDataGetLength.restype = ctypes.c_long
+        cf.CFDataGetLength.argtypes = [ctypes.c_void_p]
+        cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+        cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        sec.SecItemCopyMatching.restype = ctypes.c_int32
+        sec.SecItemCopyMatching.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+
+        def const(lib, name):
+            return ctypes.c_void_p.in_dll(lib, name).value
+
+        def addr(lib, name):
+            return ctypes.addressof(ctypes.c_char.in_dll(lib, name))
+
+        kCFStringEncodingUTF8 = 0x08000100
+        service = cf.CFStringCreateWithCString(
+            None, b"Claude Code-credentials", kCFStringEncodingUTF8)
+
+        keys = (ctypes.c_void_p * 3)(
+            const(sec, "kSecClass"),
+            const(sec, "kSecAttrService"),
+            const(sec, "kSecReturnData"),
+        )
+        values = (ctypes.c_void_p * 3)(
+            const(sec, "kSecClassGenericPassword"),
+            service,
+            const(cf, "kCFBooleanTrue"),
+        )
+        query = cf.CFDictionaryCreate(
+            None, keys, values, 3,
+            addr(cf, "kCFTypeDictionaryKeyCallBacks"),
+            addr(cf, "kCFTypeDictionaryValueCallBacks"),
+        )
+
+        result = ctypes.c_void_p()
+        status = sec.SecItemCopyMatching(query, ctypes.byref(result))
+        cf.CFRelease(service)
+        cf.CFRelease(query)
+        if status != 0 or not result.value:
+            return None
+        data = ctypes.string_at(cf.CFDataGetBytePtr(result), cf.CFDataGetLength(result))
+        cf.CFRelease(result)
+        return data
+    except (OSError, ValueError, AttributeError):
+        return None
+
 def get_access_token_macos() -> str | None:
     """Retrieve access token from macOS Keychain."""
+    credentials = _keychain_lookup_ctypes()
+    if credentials:
+        try:
+            return _loads(credentials).get("claudeAiOauth", {}).get("accessToken")
+        except (ValueError, KeyError, AttributeError):
+            return None
+
+    # Fall back to the security CLI if the framework path failed
+    import subprocess
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["security", "find-generic-password", "-s", "Claude Code-credentials", "-w"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            check=True
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=-1, text=True,
         )
-        credentials = result.stdout.strip()
+        try:
+            stdout, _ = proc.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+        if proc.returncode != 0:
+            return None
+        credentials = stdout.strip()
         if credentials:
-            creds = json.loads(credentials)
+            creds = _loads(credentials)
             return creds.get("claudeAiOauth", {}).get("accessToken")
         return None
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, KeyError):
+    except (subprocess.TimeoutExpired, OSError, ValueError, KeyError):
         return None
 
+# Parsed credentials memo keyed on the file's mtime, to avoid reparsing
+_linux_creds_memo: tuple[int, str | None] | None = None
+
 def get_access_token_linux() -> str | None:
     """Read access token from credentials file on Linux."""
+    global _linux_creds_memo
+    try:
+        mtime_ns = os.stat(CREDENTIALS_PATH).st_mtime_ns
+        if _linux_creds_memo is not None and _linux_creds_memo[0] == mtime_ns:
+            return _linux_creds_memo[1]
+        with open(CREDENTIALS_PATH, "rb") as f:
+            creds = _loads(f.read())
+        token = creds.get("claudeAiOauth", {}).get("accessToken")
+        _linux_creds_memo = (mtime_ns, token)
+        return token
+    except (OSError, ValueError, KeyError):
+        return None
+
+def load_cached_usage(path, max_age: float) -> dict | None:
+    """Return the cached usage body if fresher than max_age, else None."""
     try:
-        with open(CREDENTIALS_PATH) as f:
-            creds = json.load(f)
-        return creds.get("claudeAiOauth", {}).get("accessToken")
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        with open(path, "rb") as f:
+            record = _loads(f.read())
+        if time.time() - record["ts"] < max_age:
+            return record["body"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def save_cached_usage(path: str, body: dict) -> None:
+    """Write the usage body to the cache atomically (write temp, then rename)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"ts": time.time(), "body": body}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _get_usage_if_token() -> tuple[dict | None, bool] | None:
+    """Fuse the token lookup and usage fetch so both run on one worker thread."""
+    access_token = get_access_token()
+    if not access_token:
         return None
+    return get_usage(access_token)
+
+def get_usage(access_token: str) -> tuple[dict | None, bool]:
+    """Get usage data, serving a short-TTL disk cache to skip the API round trip.
+
+    Returns (data, stale): stale is True when the API failed and we fell back
+    to the last cached body regardless of age.
+    """
+    cached = load_cached_usage(USAGE_CACHE_PATH, USAGE_CACHE_TTL)
+    if cached is not None:
+        return cached, False
+    # Prefer the daemon's kept-alive connection; fall back to a direct fetch
+    data, daemon_alive = usage_from_daemon()
+    if data is not None:
+        return data, False
+    if daemon_alive:
+        # The daemon is mid-fetch (or just failed the same fetch we would
+        # attempt); serve the stale cache now instead of stacking a second
+        # full-timeout request — the next render picks up its result
+        stale = load_cached_usage(USAGE_CACHE_PATH, float("inf"))
+        return stale, stale is not None
+    spawn_daemon()  # warm the daemon for the next render (best effort)
+    import urllib.error
+    try:
+        data = fetch_usage(access_token)
+    except urllib.error.HTTPError:
+        # Cached token was rejected; drop it and retry once with a fresh one
+        invalidate_token_cache()
+        data = None
+        fresh_token = get_access_token(fresh=True)
+        if fresh_token:
+            try:
+                data = fetch_usage(fresh_token)
+            except urllib.error.HTTPError:
+                data = None
+    if data is not None:
+        save_cached_usage(USAGE_CACHE_PATH, data)
+        return data, False
+    # API failed: fall back to the last cached body, however old
+    stale = load_cached_usage(USAGE_CACHE_PATH, float("inf"))
+    return stale, stale is not None
+
+def usage_from_daemon() -> tuple[dict | None, bool]:
+    """Ask the statusline daemon for the usage body over its Unix socket.
+
+    The daemon holds a kept-alive HTTPS connection, so this is ~1ms on its
+    warm cache. The wait is kept short: if the daemon is alive but mid-fetch,
+    we report (None, True) so the caller can serve stale data now rather
+    than blocking a render behind the API call.
+
+    Returns (body, daemon_alive).
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(DAEMON_TIMEOUT)
+            s.connect(DAEMON_SOCKET_PATH)
+            try:
+                s.sendall(b"GET\n")
+                chunks = []
+                while chunk := s.recv(65536):
+                    chunks.append(chunk)
+            except TimeoutError:
+                return None, True  # alive but busy fetching
+        body = b"".join(chunks)
+        if not body:
+            return None, True
+        return _loads(body), True
+    except (OSError, ValueError):
+        return None, False
+
+def spawn_daemon() -> None:
+    """Start the usage daemon in the background if it ships alongside us."""
+    daemon = os.path.join(os.path.dirname(os.path.abspath(__file__)), "statusline-daemon.py")
+    if not os.path.exists(daemon):
+        return
+    import subprocess
+    try:
+        subprocess.Popen(
+            [sys.executable, daemon],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, start_new_session=True,
+        )
+    except OSError:
+        pass
 
 def fetch_usage(access_token: str) -> dict | None:
     """Fetch usage data from Anthropic API."""
+    import urllib.error
+    import urllib.request
     try:
         req = urllib.request.Request(
             USAGE_API_URL,
@@ -192,8 +589,12 @@ def fetch_usage(access_token: str) -> dict | None:
             },
         )
         with urllib.request.urlopen(req, timeout=5) as resp:
-            return json.loads(resp.read().decode())
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError):
+            return _loads(resp.read())
+    except urllib.error.HTTPError as e:
+        if e.code in (401, 403):
+            raise  # let the caller invalidate the token cache and retry
+        return None
+    except (urllib.error.URLError, ValueError, TimeoutError):
         return None
 
 def rgb_fg(r, g, b):
@@ -238,17 +639,17 @@ def format_time_remaining(resets_at: str | None) -> str:
     except (ValueError, TypeError):
         return ""
 
-def get_progress_bar(progress, total=100, width=10, emoji=None, reset_time=None):
-    percent = progress / total
+def _render_bar(pct: int, width: int = 10) -> str:
+    """Render the colored bar string for an integer percentage (0-100)."""
     total_blocks = width * 8  # 8 sub-blocks per character
-    filled_blocks = int(percent * total_blocks)
+    filled_blocks = pct * total_blocks // 100
 
     full_chars = filled_blocks // 8
     remainder = filled_blocks % 8
     empty = width - full_chars
 
     # Get colors based on progress percentage
-    color = get_usage_color_rgb(progress)
+    color = get_usage_color_rgb(pct)
     dim_color = tuple(int(c * DIM_FACTOR) for c in color)
 
     # Build bar with foreground color and dim background
@@ -262,21 +663,26 @@ def get_progress_bar(progress, total=100, width=10, emoji=None, reset_time=None)
         empty -= 1
     bar += " " * empty
     bar += RESET + fg
+    return bar
 
-    # Format percentage based on whether it's a whole number
-    if progress == int(progress):
-        pct_str = f"{int(progress)}%"
-    else:
-        pct_str = f"{progress:.0f}%"
+# Every render draws up to three bars; precompute all 101 once (~5KB),
+# with the percentage label attached (still inside the bar's color)
+_BARS = tuple(_render_bar(p) for p in range(101))
+_BAR_PCTS = tuple(f"{_BARS[p]} {p}%" for p in range(101))
 
+def _format_bar(progress) -> str:
+    """Colored bar plus percentage label, via table lookup."""
+    return _BAR_PCTS[max(0, min(100, int(round(progress))))]
+
+def get_progress_bar(progress, emoji=None, reset_time=None):
     # Add reset time if provided
     time_str = format_time_remaining(reset_time)
     suffix = f" ({time_str})" if time_str else ""
 
     prefix = f"{emoji} " if emoji else ""
-    return f"{prefix}{bar} {pct_str}{suffix}{RESET}"
+    return f"{prefix}{_format_bar(progress)}{suffix}{RESET}"
 
-def format_usage(usage_data: dict) -> str:
+def format_usage(usage_data: dict, stale: bool = False) -> str:
     """Format usage data for statusline display."""
     if not usage_data:
         return f"{RED}Usage: N/A{RESET}"
@@ -293,7 +699,24 @@ def format_usage(usage_data: dict) -> str:
     five_hour_str = get_progress_bar(five_hour_percentage, emoji="🕔", reset_time=five_hour_resets)
     weekly_str = get_progress_bar(weekly_percentage, emoji="📅", reset_time=weekly_resets)
 
-    return f"{five_hour_str} · {weekly_str}"
+    stale_str = f" {YELLOW}(stale){RESET}" if stale else ""
+    return f"{five_hour_str} · {weekly_str}{stale_str}"
+
+def exec_compiled_statusline() -> None:
+    """Hand off to the compiled statusline binary when it's installed.
+
+    `go build -o statusline statusline.go` next to this script produces a
+    binary with the same stdin/stdout protocol but no interpreter startup;
+    exec it so this process is replaced entirely. No-op if it's absent.
+    """
+    binary = os.path.join(os.path.dirname(os.path.abspath(__file__)), "statusline")
+    if not os.access(binary, os.X_OK):
+        return
+    try:
+        os.execv(binary, [binary] + sys.argv[1:])
+    except OSError:
+        pass
 
 if __name__ == "__main__":
+    exec_compiled_statusline()
     main()